@@ -1,417 +1,399 @@
+import asyncio
+import inspect
 import os
+import random
+import re
+import string
+from contextlib import asynccontextmanager
 from typing import Optional
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
 import httpx
+from cachetools import LRUCache, TTLCache
 from fastmcp import FastMCP, Context
-
-mcp = FastMCP("MMS Flexo Layer 1 Service")
+from fastmcp.exceptions import ToolError
 
 MMS_URL = os.getenv("MMS_URL", "")
+MMS_BASE_URL = MMS_URL.rstrip('/')
 READ_ONLY = os.getenv("READ_ONLY", "true").lower() == "true"
 MCPPATH = os.getenv("MCPPATH", "/mcp")
+GET_CACHE_TTL = float(os.getenv("GET_CACHE_TTL", "5"))
+GET_CACHE_SIZE = int(os.getenv("GET_CACHE_SIZE", "1024"))
+GET_CACHE_ENABLED = GET_CACHE_TTL > 0 and GET_CACHE_SIZE > 0
+MMS_MAX_RETRIES = max(0, int(os.getenv("MMS_MAX_RETRIES", "3")))
+MMS_MAX_INFLIGHT = max(1, int(os.getenv("MMS_MAX_INFLIGHT", "32")))
+MAX_BODY_BYTES = int(os.getenv("MAX_BODY_BYTES", str(16 * 1024 * 1024)))
+
+# Bodies longer than this many characters are encoded in a worker thread
+LARGE_BODY_CHARS = 1_000_000
+
+TURTLE = "text/turtle"
+SPARQL_QUERY = "application/sparql-query"
+SPARQL_UPDATE = "application/sparql-update"
+
+# IDs become single URL path segments, so they must be plain unreserved-character tokens
+# that can't smuggle in "/", "..", "?", "#" or percent-escapes
+ID_RE = re.compile(r"\A[A-Za-z0-9_~-][A-Za-z0-9._~-]{0,127}\Z")
+
+# MMS statuses that mean "try again later" rather than a failed request
+RETRY_STATUSES = (429, 503)
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Caps concurrent MMS requests so bursts of tool calls (e.g. batch_read) queue here instead of overloading MMS
+_inflight = asyncio.Semaphore(MMS_MAX_INFLIGHT)
+
+# GET responses keyed by (path, Authorization): fresh bodies, and the last ETag seen for revalidation
+# (cachetools rejects every insert into a zero-size cache, so keep at least one slot when disabled)
+_get_cache: TTLCache = TTLCache(maxsize=max(1, GET_CACHE_SIZE), ttl=GET_CACHE_TTL)
+_etag_cache: LRUCache = LRUCache(maxsize=max(1, GET_CACHE_SIZE))
+# Bumped on every write, so a GET only caches its result if no write started while it was in flight
+_cache_generation = 0
+
+def make_transport(proxy: Optional[str] = None) -> httpx.AsyncHTTPTransport:
+    """Build a transport that retries failed connection attempts.
+    
+    Limits and http2 must be set here, since the client ignores its own copies
+    when given a transport.
+    """
+    return httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        retries=2,
+        proxy=proxy,
+    )
+
+def mms_proxy() -> Optional[str]:
+    """Return the proxy URL for MMS from HTTP(S)_PROXY/ALL_PROXY, honoring NO_PROXY."""
+    url = urlsplit(MMS_BASE_URL)
+    proxies = getproxies()
+    proxy = proxies.get(url.scheme) or proxies.get("all")
+    if not proxy or not url.hostname or proxy_bypass(url.netloc):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared MMS client, creating it on first use."""
+    global _client
+    if _client is None:
+        # httpx skips HTTP(S)_PROXY/ALL_PROXY/NO_PROXY once a transport is passed, so the
+        # proxy for the single MMS host is resolved here instead. (httpx does not forward
+        # connect retries to proxy pools; limits and http2 still apply.)
+        _client = httpx.AsyncClient(
+            base_url=MMS_BASE_URL,
+            transport=make_transport(mms_proxy()),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _client
+
+async def warm_up():
+    """Open a connection to MMS so the first tool call doesn't pay for DNS, TCP and TLS setup."""
+    try:
+        await get_client().get("/")
+    except httpx.HTTPError:
+        pass
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Keep one pooled MMS client open for the lifetime of the server."""
+    global _client
+    get_client()
+    warm_up_task = asyncio.create_task(warm_up()) if MMS_URL else None
+    try:
+        yield
+    finally:
+        if warm_up_task is not None:
+            warm_up_task.cancel()
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+mcp = FastMCP("MMS Flexo Layer 1 Service", lifespan=lifespan)
 
 def get_auth_header(ctx: Context) -> dict:
-    """Extract Authorization header from request context."""
-    headers = ctx.request_context.request.headers
-    auth_header = headers.get("authorization") or headers.get("Authorization")
-    if auth_header:
-        return {"Authorization": auth_header}
-    return {}
+    """Extract Authorization header from request context.
+    
+    The result is cached on the request state, so callers must not mutate it.
+    """
+    request = ctx.request_context.request
+    auth = getattr(request.state, "auth_headers", None)
+    if auth is None:
+        # Starlette headers are case-insensitive, so one lookup covers both spellings
+        auth_header = request.headers.get("authorization")
+        auth = {"Authorization": auth_header} if auth_header else {}
+        request.state.auth_headers = auth
+    return auth
+
+def get_request_headers(ctx: Context, content_type: Optional[str] = None) -> dict:
+    """Return the headers for an MMS request.
+    
+    Built once per content type and cached on the request state alongside the
+    auth header, so callers must not mutate the result.
+    """
+    state = ctx.request_context.request.state
+    cache = getattr(state, "request_headers", None)
+    if cache is None:
+        cache = state.request_headers = {}
+    headers = cache.get(content_type)
+    if headers is None:
+        headers = get_auth_header(ctx)
+        if content_type:
+            headers = {**headers, "Content-Type": content_type}
+        cache[content_type] = headers
+    return headers
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring a numeric Retry-After header."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), 30.0)
+    return min(0.2 * 2 ** attempt, 2.0) + random.uniform(0, 0.2)
+
+def encode_body(body: str) -> bytes:
+    """Encode a request body as UTF-8, enforcing MAX_BODY_BYTES."""
+    # Every character is at least one UTF-8 byte, so an over-long str is rejected before encoding
+    if len(body) > MAX_BODY_BYTES or len(encoded := body.encode("utf-8")) > MAX_BODY_BYTES:
+        raise ValueError(f"Request body exceeds MAX_BODY_BYTES ({MAX_BODY_BYTES})")
+    return encoded
+
+async def send_request(
+    method: str,
+    path: str,
+    headers: dict,
+    body: Optional[bytes],
+    cached: Optional[tuple] = None,
+) -> tuple:
+    """Send one MMS request, retrying 429/503, and return (text, ETag).
+    
+    A 304 reply to a conditional GET returns the text stored in `cached`.
+    """
+    for attempt in range(MMS_MAX_RETRIES + 1):
+        async with _inflight, get_client().stream(method, path, headers=headers, content=body) as response:
+            if cached and response.status_code == 304:
+                return cached[1], cached[0]
+            if response.is_success:
+                await response.aread()
+                # Tools return str because FastMCP serializes a bytes result as a quoted
+                # JSON string. httpx's .text falls back to UTF-8 for missing or unknown
+                # charsets and replaces undecodable bytes rather than failing the tool.
+                return response.text, response.headers.get("ETag")
+            if response.status_code not in RETRY_STATUSES or attempt == MMS_MAX_RETRIES:
+                await response.aread()
+                raise ToolError(f"MMS returned {response.status_code} for {method} {path}: {response.text[:512]}")
+            delay = retry_delay(response, attempt)
+        await asyncio.sleep(delay)
+
+def invalidate_get_cache():
+    """Drop cached GET responses and stop in-flight GETs from storing theirs."""
+    global _cache_generation
+    _cache_generation += 1
+    _get_cache.clear()
+    _etag_cache.clear()
+
+async def cached_get(path: str, headers: dict) -> str:
+    """GET `path`, serving and storing results in the GET caches."""
+    cache_key = (path, headers.get("Authorization"))
+    hit = _get_cache.get(cache_key)
+    if hit is not None:
+        return hit
+    cached = _etag_cache.get(cache_key)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
+    
+    generation = _cache_generation
+    text, etag = await send_request("GET", path, headers, None, cached)
+    # A write that started after this GET was sent may have made its result stale
+    if generation == _cache_generation:
+        _get_cache[cache_key] = text
+        if etag:
+            _etag_cache[cache_key] = (etag, text)
+    return text
 
 async def make_request(
     method: str,
     path: str,
     ctx: Context,
-    body: Optional[str] = None,
+    body: Optional[bytes] = None,
     content_type: Optional[str] = None
 ) -> str:
-    """Make HTTP request to MMS API."""
+    """Make HTTP request to MMS API.
+    
+    The body is sent as-is; tools encode it with encode_body() first.
+    """
     if not MMS_URL:
         raise ValueError("MMS_URL environment variable is not set")
     
-    url = f"{MMS_URL.rstrip('/')}{path}"
-    headers = get_auth_header(ctx)
-    
-    if content_type:
-        headers["Content-Type"] = content_type
-    
-    async with httpx.AsyncClient() as client:
-        if method == "GET":
-            response = await client.get(url, headers=headers)
-        elif method == "PUT":
-            response = await client.put(url, headers=headers, content=body or "")
-        elif method == "PATCH":
-            response = await client.patch(url, headers=headers, content=body or "")
-        elif method == "POST":
-            response = await client.post(url, headers=headers, content=body or "")
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        response.raise_for_status()
-        return response.text
-
-def register_tools():
-    @mcp.tool()
-    async def read_all_orgs(ctx: Context) -> str:
-        """Read all organizations."""
-        return await make_request("GET", "/orgs", ctx)
-
-    @mcp.tool()
-    async def read_org(org_id: str, ctx: Context) -> str:
-        """Read a specific organization.
-        
-        Args:
-            org_id: The organization ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}", ctx)
-
-    @mcp.tool()
-    async def read_all_repos(org_id: str, ctx: Context) -> str:
-        """Read all repositories in an organization.
-        
-        Args:
-            org_id: The organization ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos", ctx)
-
-    @mcp.tool()
-    async def read_repo(org_id: str, repo_id: str, ctx: Context) -> str:
-        """Read a specific repository.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}", ctx)
-
-    @mcp.tool()
-    async def read_all_branches(org_id: str, repo_id: str, ctx: Context) -> str:
-        """Read all branches in a repository.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/branches", ctx)
-
-    @mcp.tool()
-    async def read_branch(org_id: str, repo_id: str, branch_id: str, ctx: Context) -> str:
-        """Read a specific branch.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            branch_id: The branch ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}", ctx)
-
-    @mcp.tool()
-    async def read_model(org_id: str, repo_id: str, branch_id: str, ctx: Context) -> str:
-        """Read the model at the HEAD of a branch.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            branch_id: The branch ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/graph", ctx)
-
-    @mcp.tool()
-    async def query_model(org_id: str, repo_id: str, branch_id: str, sparql_query: str, ctx: Context) -> str:
-        """Query the model at the HEAD of a branch.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            branch_id: The branch ID
-            sparql_query: SPARQL 1.1 query string
-        """
-        return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/query", ctx, sparql_query, "application/sparql-query")
-
-    @mcp.tool()
-    async def read_all_locks(org_id: str, repo_id: str, ctx: Context) -> str:
-        """Read all locks in a repository.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/locks", ctx)
-
-    @mcp.tool()
-    async def read_lock(org_id: str, repo_id: str, lock_id: str, ctx: Context) -> str:
-        """Read a specific lock.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            lock_id: The lock ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/locks/{lock_id}", ctx)
-
-    @mcp.tool()
-    async def query_lock(org_id: str, repo_id: str, lock_id: str, sparql_query: str, ctx: Context) -> str:
-        """Query the model under the commit pointed to by the given lock.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            lock_id: The lock ID
-            sparql_query: SPARQL 1.1 query string
-        """
-        return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/locks/{lock_id}/query", ctx, sparql_query, "application/sparql-query")
-
-    @mcp.tool()
-    async def query_diff(org_id: str, repo_id: str, sparql_query: str, ctx: Context) -> str:
-        """Query the given diff.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            sparql_query: SPARQL 1.1 query string
-        """
-        return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/diff/query", ctx, sparql_query, "application/sparql-query")
-
-    @mcp.tool()
-    async def query_repo(org_id: str, repo_id: str, sparql_query: str, ctx: Context) -> str:
-        """Query the metadata graph for the given repository.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            sparql_query: SPARQL 1.1 query string
-        """
-        return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/query", ctx, sparql_query, "application/sparql-query")
-
-    @mcp.tool()
-    async def read_all_scratches(org_id: str, repo_id: str, ctx: Context) -> str:
-        """Read all scratches in a repository.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/scratches", ctx)
+    headers = get_request_headers(ctx, content_type)
     
-    @mcp.tool()
-    async def read_scratch(org_id: str, repo_id: str, scratch_id: str, ctx: Context) -> str:
-        """Read a specific scratch.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            scratch_id: The scratch ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/scratches/{scratch_id}", ctx)
-
-    @mcp.tool()
-    async def query_scratch(org_id: str, repo_id: str, scratch_id: str, sparql_query: str, ctx: Context) -> str:
-        """Query the model under the given scratch.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            scratch_id: The scratch ID
-            sparql_query: SPARQL 1.1 query string
-        """
-        return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/scratches/{scratch_id}/query", ctx, sparql_query, "application/sparql-query")
+    if method == "GET" and GET_CACHE_ENABLED:
+        return await cached_get(path, headers)
+    if method == "GET" or path.endswith("/query"):
+        return (await send_request(method, path, headers, body))[0]
     
-    @mcp.tool()
-    async def read_scratch_model(org_id: str, repo_id: str, scratch_id: str, ctx: Context) -> str:
-        """Read the model at the scratch.
-        
-        Args:
-            org_id: The organization ID
-            repo_id: The repository ID
-            scratch_id: The scratch ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/repos/{repo_id}/scratches/{scratch_id}/graph", ctx)
-
-    @mcp.tool()
-    async def read_all_collections(org_id: str, ctx: Context) -> str:
-        """Read all collections in an org.
-        
-        Args:
-            org_id: The organization ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/collections", ctx)
+    # Anything other than a read or query may change MMS state. Clearing before the
+    # write stops later reads using older results; clearing after it drops anything a
+    # read cached while the write was still in progress.
+    invalidate_get_cache()
+    try:
+        return (await send_request(method, path, headers, body))[0]
+    finally:
+        invalidate_get_cache()
+
+PARAM_DOCS = {
+    "org_id": "The organization ID",
+    "repo_id": "The repository ID",
+    "branch_id": "The branch ID",
+    "lock_id": "The lock ID",
+    "scratch_id": "The scratch ID",
+    "collection_id": "The collection ID",
+    "policy_id": "The policy ID",
+    "group_id": "The group ID",
+    "body": "RDF content in Turtle format",
+    "rdf_content": "RDF content to load in turtle format",
+    "sparql_query": "SPARQL 1.1 query string",
+    "sparql_update": "SPARQL 1.1 update string",
+}
+
+def make_tool(
+    name: str,
+    method: str,
+    path: str,
+    body_param: Optional[str] = None,
+    content_type: Optional[str] = None,
+    summary: str = "",
+    param_docs: Optional[dict] = None,
+):
+    """Build a tool that sends a single MMS request.
     
-    @mcp.tool()
-    async def read_collection(org_id: str, collection_id: str, ctx: Context) -> str:
-        """Read a specific collection.
-        
-        Args:
-            org_id: The organization ID
-            collection_id: The sccollection ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/collections/{collection_id}", ctx)
-
-    @mcp.tool()
-    async def query_collection(org_id: str, collection_id: str, sparql_query: str, ctx: Context) -> str:
-        """Query the model under the given scratch.
-        
-        Args:
-            org_id: The organization ID
-            collection_id: The collection ID
-            sparql_query: SPARQL 1.1 query string
-        """
-        return await make_request("POST", f"/orgs/{org_id}/collections/{collection_id}/query", ctx, sparql_query, "application/sparql-query")
+    Args:
+        name: The tool name
+        method: HTTP method
+        path: str.format template for the request path; its fields become tool parameters
+        body_param: Name of the parameter sent as the request body, if any
+        content_type: Content-Type of the request body
+        summary: First line of the tool description
+        param_docs: Per-tool overrides for PARAM_DOCS
+    """
+    path_fields = [field for _, field, _, _ in string.Formatter().parse(path) if field]
+    params = list(path_fields)
+    if body_param:
+        params.append(body_param)
+    docs = {**PARAM_DOCS, **(param_docs or {})}
+
+    async def tool(ctx: Context, **kwargs) -> str:
+        for field in path_fields:
+            if not ID_RE.match(kwargs[field]):
+                raise ValueError(f"Invalid {field}: {kwargs[field][:256]!r}")
+        body = kwargs.get(body_param)
+        if body is not None:
+            # Encoding a multi-megabyte RDF upload would stall every other tool call on the loop
+            if len(body) > LARGE_BODY_CHARS:
+                body = await asyncio.to_thread(encode_body, body)
+            else:
+                body = encode_body(body)
+        return await make_request(method, path.format(**kwargs), ctx, body, content_type)
+
+    # FastMCP derives the tool schema from the signature, so expose the real parameters
+    tool.__signature__ = inspect.Signature(
+        [inspect.Parameter(p, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str) for p in params]
+        + [inspect.Parameter("ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Context)],
+        return_annotation=str,
+    )
+    tool.__annotations__ = {**{p: str for p in params}, "ctx": Context, "return": str}
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = summary
+    if params:
+        tool.__doc__ += "\n\nArgs:\n" + "\n".join(f"    {p}: {docs[p]}" for p in params)
+    return tool
+
+READ_TOOLS = [
+    ("read_all_orgs", "GET", "/orgs", None, None, "Read all organizations."),
+    ("read_org", "GET", "/orgs/{org_id}", None, None, "Read a specific organization."),
+    ("read_all_repos", "GET", "/orgs/{org_id}/repos", None, None, "Read all repositories in an organization."),
+    ("read_repo", "GET", "/orgs/{org_id}/repos/{repo_id}", None, None, "Read a specific repository."),
+    ("read_all_branches", "GET", "/orgs/{org_id}/repos/{repo_id}/branches", None, None, "Read all branches in a repository."),
+    ("read_branch", "GET", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}", None, None, "Read a specific branch."),
+    ("read_model", "GET", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/graph", None, None,
+     "Read the model at the HEAD of a branch."),
+    ("query_model", "POST", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/query", "sparql_query", SPARQL_QUERY,
+     "Query the model at the HEAD of a branch."),
+    ("read_all_locks", "GET", "/orgs/{org_id}/repos/{repo_id}/locks", None, None, "Read all locks in a repository."),
+    ("read_lock", "GET", "/orgs/{org_id}/repos/{repo_id}/locks/{lock_id}", None, None, "Read a specific lock."),
+    ("query_lock", "POST", "/orgs/{org_id}/repos/{repo_id}/locks/{lock_id}/query", "sparql_query", SPARQL_QUERY,
+     "Query the model under the commit pointed to by the given lock."),
+    ("query_diff", "POST", "/orgs/{org_id}/repos/{repo_id}/diff/query", "sparql_query", SPARQL_QUERY, "Query the given diff."),
+    ("query_repo", "POST", "/orgs/{org_id}/repos/{repo_id}/query", "sparql_query", SPARQL_QUERY,
+     "Query the metadata graph for the given repository."),
+    ("read_all_scratches", "GET", "/orgs/{org_id}/repos/{repo_id}/scratches", None, None, "Read all scratches in a repository."),
+    ("read_scratch", "GET", "/orgs/{org_id}/repos/{repo_id}/scratches/{scratch_id}", None, None, "Read a specific scratch."),
+    ("query_scratch", "POST", "/orgs/{org_id}/repos/{repo_id}/scratches/{scratch_id}/query", "sparql_query", SPARQL_QUERY,
+     "Query the model under the given scratch."),
+    ("read_scratch_model", "GET", "/orgs/{org_id}/repos/{repo_id}/scratches/{scratch_id}/graph", None, None,
+     "Read the model at the scratch."),
+    ("read_all_collections", "GET", "/orgs/{org_id}/collections", None, None, "Read all collections in an org."),
+    ("read_collection", "GET", "/orgs/{org_id}/collections/{collection_id}", None, None, "Read a specific collection."),
+    ("query_collection", "POST", "/orgs/{org_id}/collections/{collection_id}/query", "sparql_query", SPARQL_QUERY,
+     "Query the model under the given collection."),
+    ("read_collection_model", "GET", "/orgs/{org_id}/collections/{collection_id}/graph", None, None,
+     "Read the model at the collection."),
+]
+
+WRITE_TOOLS = [
+    ("create_org", "PUT", "/orgs/{org_id}", "body", TURTLE, "Create an organization."),
+    ("update_org", "PATCH", "/orgs/{org_id}", "body", TURTLE, "Update an organization."),
+    ("create_repo", "PUT", "/orgs/{org_id}/repos/{repo_id}", "body", TURTLE, "Create a repository."),
+    ("update_repo", "PATCH", "/orgs/{org_id}/repos/{repo_id}", "body", TURTLE, "Update a repository."),
+    ("create_branch", "PUT", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}", "body", TURTLE, "Create a branch."),
+    ("update_branch", "PATCH", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}", "body", TURTLE, "Update a branch."),
+    ("load_model", "PUT", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/graph", "rdf_content", TURTLE,
+     "Replace the model at the HEAD of a branch by uploading an RDF file."),
+    ("commit_model", "POST", "/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/update", "sparql_update", SPARQL_UPDATE,
+     "Commit a change to the model by applying a SPARQL UPDATE."),
+    ("create_lock", "PUT", "/orgs/{org_id}/repos/{repo_id}/locks/{lock_id}", "sparql_update", SPARQL_UPDATE, "Create a lock."),
+    ("create_diff", "POST", "/orgs/{org_id}/repos/{repo_id}/diff", "sparql_query", SPARQL_QUERY, "Create a diff between two commits."),
+    ("create_collection", "PUT", "/orgs/{org_id}/collections/{collection_id}", "body", TURTLE, "Create a collection.",
+     {"body": "RDF content in Turtle format, use <> mms:collects {refs} . to define other branches, locks, or scratches to collect"}),
+    ("create_policy", "PUT", "/policies/{policy_id}", "body", TURTLE, "Create a policy."),
+    ("create_group", "PUT", "/groups/{group_id}", "body", TURTLE, "Create a group."),
+]
+
+read_tools = [mcp.tool(make_tool(*spec)) for spec in READ_TOOLS]
+
+# Plain GET reads that batch_read may fan out, keyed by tool name
+batch_ops = {tool.name: tool.fn for tool, spec in zip(read_tools, READ_TOOLS) if spec[1] == "GET"}
+
+@mcp.tool()
+async def batch_read(requests: list[dict], ctx: Context) -> list[str]:
+    """Issue several read operations concurrently, returning results in request order.
     
-    @mcp.tool()
-    async def read_collection_model(org_id: str, collection_id: str, ctx: Context) -> str:
-        """Read the model at the scratch.
-        
-        Args:
-            org_id: The organization ID
-            collection_id: The collection ID
-        """
-        return await make_request("GET", f"/orgs/{org_id}/collections/{collection_id}/graph", ctx)
-
-    if not READ_ONLY:
-        @mcp.tool()
-        async def create_org(org_id: str, body: str, ctx: Context) -> str:
-            """Create an organization.
-            
-            Args:
-                org_id: The organization ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PUT", f"/orgs/{org_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def update_org(org_id: str, body: str, ctx: Context) -> str:
-            """Update an organization.
-            
-            Args:
-                org_id: The organization ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PATCH", f"/orgs/{org_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def create_repo(org_id: str, repo_id: str, body: str, ctx: Context) -> str:
-            """Create a repository.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PUT", f"/orgs/{org_id}/repos/{repo_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def update_repo(org_id: str, repo_id: str, body: str, ctx: Context) -> str:
-            """Update a repository.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PATCH", f"/orgs/{org_id}/repos/{repo_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def create_branch(org_id: str, repo_id: str, branch_id: str, body: str, ctx: Context) -> str:
-            """Create a branch.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                branch_id: The branch ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PUT", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def update_branch(org_id: str, repo_id: str, branch_id: str, body: str, ctx: Context) -> str:
-            """Update a branch.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                branch_id: The branch ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PATCH", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def load_model(org_id: str, repo_id: str, branch_id: str, rdf_content: str, ctx: Context) -> str:
-            """Replace the model at the HEAD of a branch by uploading an RDF file.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                branch_id: The branch ID
-                rdf_content: RDF content to load in turtle format
-            """
-            return await make_request("PUT", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/graph", ctx, rdf_content, "text/turtle")
-
-        @mcp.tool()
-        async def commit_model(org_id: str, repo_id: str, branch_id: str, sparql_update: str, ctx: Context) -> str:
-            """Commit a change to the model by applying a SPARQL UPDATE.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                branch_id: The branch ID
-                sparql_update: SPARQL 1.1 update string
-            """
-            return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/branches/{branch_id}/update", ctx, sparql_update, "application/sparql-update")
-
-        @mcp.tool()
-        async def create_lock(org_id: str, repo_id: str, lock_id: str, sparql_update: str, ctx: Context) -> str:
-            """Create a lock.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                lock_id: The lock ID
-                sparql_update: SPARQL 1.1 update string
-            """
-            return await make_request("PUT", f"/orgs/{org_id}/repos/{repo_id}/locks/{lock_id}", ctx, sparql_update, "application/sparql-update")
-
-        @mcp.tool()
-        async def create_diff(org_id: str, repo_id: str, sparql_query: str, ctx: Context) -> str:
-            """Create a diff between two commits.
-            
-            Args:
-                org_id: The organization ID
-                repo_id: The repository ID
-                sparql_query: SPARQL 1.1 query string
-            """
-            return await make_request("POST", f"/orgs/{org_id}/repos/{repo_id}/diff", ctx, sparql_query, "application/sparql-query")
-
-        @mcp.tool()
-        async def create_collection(org_id: str, collection_id: str, body: str, ctx: Context) -> str:
-            """Create a collection.
-            
-            Args:
-                org_id: The organization ID
-                collection_id: The collection ID
-                body: RDF content in Turtle format, use <> mms:collects {refs} . to define other branches, locks, or scratches to collect 
-            """
-            return await make_request("PUT", f"/orgs/{org_id}/collections/{collection_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def create_policy(policy_id: str, body: str, ctx: Context) -> str:
-            """Create a policy.
-            
-            Args:
-                policy_id: The policy ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PUT", f"/policies/{policy_id}", ctx, body, "text/turtle")
-
-        @mcp.tool()
-        async def create_group(group_id: str, body: str, ctx: Context) -> str:
-            """Create a group.
-            
-            Args:
-                group_id: The group ID
-                body: RDF content in Turtle format
-            """
-            return await make_request("PUT", f"/groups/{group_id}", ctx, body, "text/turtle")
-
-register_tools()
+    Args:
+        requests: List of {"op": <read tool name>, "args": {<tool arguments>}}, e.g. {"op": "read_repo", "args": {"org_id": "o", "repo_id": "r"}}
+    """
+    # The tools are called directly, bypassing FastMCP's argument validation, so check
+    # every entry against the tool's signature before sending anything
+    for request in requests:
+        op = request.get("op")
+        if op not in batch_ops:
+            raise ValueError(f"Unsupported batch operation: {op}")
+        args = request.get("args", {})
+        try:
+            inspect.signature(batch_ops[op]).bind(**args, ctx=ctx)
+        except TypeError as e:
+            raise ValueError(f"Invalid arguments for {op}: {e}") from None
+        # Every read tool parameter is a string ID
+        for name, value in args.items():
+            if not isinstance(value, str):
+                raise ValueError(f"Invalid arguments for {op}: {name} must be a string, got {type(value).__name__}")
+    return await asyncio.gather(
+        *(batch_ops[request["op"]](**request.get("args", {}), ctx=ctx) for request in requests)
+    )
+
+write_tools = [] if READ_ONLY else [mcp.tool(make_tool(*spec)) for spec in WRITE_TOOLS]
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     mcp.run(transport="streamable-http", host="0.0.0.0", port=8000, path=MCPPATH)